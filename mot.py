@@ -1,17 +1,68 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString
 import pandas as pd
 import re
-from typing import List, Dict
-import numpy as np
-from io import StringIO
+import asyncio
+from functools import lru_cache
+from typing import List
+from concurrent.futures import ThreadPoolExecutor
+
+# Arrow-backed strings when pyarrow is available, pandas' own string dtype otherwise
+try:
+    import pyarrow  # noqa: F401
+    _STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    _STRING_DTYPE = "string"
+
+# httpx (with its http2 extra) is only needed for fetch_all_dropdowns_http2
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 BASE_URL = "https://www.gov.uk/guidance/mot-inspection-manual-for-private-passenger-and-light-commercial-vehicles"
 
-
+# Heading numbers, e.g. "1.1.1 Service brake control" and "1.1.1.1 ..."
+_H3_PAT = re.compile(r"^(\d+\.[0-9]+\.[0-9]+)")
+_H4_PAT = re.compile(r"^(\d+\.[0-9]+\.[0-9]+\.[0-9])")
+# Defect severities kept from the Category column, matched as whole space-separated words
+_CATEGORY_PAT = re.compile(r"(?<!\S)(?:Minor|Major|Dangerous)(?!\S)")
+# Numbered manual sections on the base page, e.g. "1. Brakes"
+_LEADS_WITH_DIGIT = re.compile(r"\s*\d")
+# Dotted number at the start of a heading, "1.2.3. Name" -> "1.2.3"
+_NUM_PREFIX = re.compile(r"^(\d+(?:\.\d+)*)")
+# Defect text helpers used by split_and_prepend_defects / extract_parentheses
+_FIRST_PAREN = re.compile(r"^(.*?)(?=\(\s*[a-z]+\))")
+_ROMAN_SPLIT = re.compile(r"(?=\(\s*[ivxlcdm]+\))")
+_FIRST_MATCH = re.compile(r"\([^()]*\)")
+_ROMAN_PARENS = re.compile(r"\(\s*[ivxlcdm]+\s*\)")
+# generate_mot_table tidy-up: "1.2. Name" -> ("2", "Name"), "(a) ..." -> "a", "1.1 (a) (ii)" -> ("a", "ii")
+_SEC_EXTRACT = re.compile(r"^\s*(?:\d+\.)*?(\d+)\.?\s+(.*)$", re.DOTALL)
+_TYPE_REF = re.compile(r"^[()]*(\S*?)[()]*(?:\s|$)")
+_SUB_TYPE_REF = re.compile(r"\(([^)]+)\)\s*\(([^)]+)\)")
+# Collapses cell whitespace the same way pd.read_html does
+_CELL_WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+
+_HEADERS = {"User-Agent": "mot_scraper", "Accept-Encoding": "gzip"}
+
+# One shared session so every section download reuses the same keep-alive connection to gov.uk.
+# Callers raise_for_status() on each response so error pages are never parsed, or kept by the lru caches.
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])),
+)
+
+
+@lru_cache(maxsize=8)
 def get_section_urls(url: str = BASE_URL) -> List[str]:
     """
     Retrieve section URLs from the MOT inspection manual base page.
+    Results are cached per url, call get_section_urls.cache_clear() to download the page again.
+        The cached list is shared between calls, so don't modify it in place.
 
     Args:
         url (str): The base URL of the MOT inspection manual. Defaults to BASE_URL.
@@ -19,21 +70,25 @@ def get_section_urls(url: str = BASE_URL) -> List[str]:
     Returns:
         List[str]: A list of URLs for each section in the manual.
     """
-    base_html = requests.get(url).text
-    base_soup = BeautifulSoup(base_html, "html.parser")
-    all_links = base_soup.find_all("li", class_="gem-c-document-list__item")
+    response = _SESSION.get(url, timeout=30)
+    response.raise_for_status()
+    base_soup = BeautifulSoup(response.text, "lxml")
+    all_links = base_soup.select("li.gem-c-document-list__item")
     links = [
-        "/".join([BASE_URL, link.div.a["href"].split("/")[-1]])
+        f"{BASE_URL}/{link.div.a['href'].rsplit('/', 1)[-1]}"
         for link in all_links
-        if link.div.text.strip()[0].isdigit()
+        if _LEADS_WITH_DIGIT.match(link.div.text)
     ]
 
     return links
 
 
+@lru_cache(maxsize=64)
 def get_dropdowns(url: str) -> List[BeautifulSoup]:
     """
     Retrieve dropdown sections from a given MOT inspection manual section page.
+    Results are cached per url so reruns don't hit gov.uk again, call get_dropdowns.cache_clear()
+        for fresh data. The cached list is shared between calls, so don't modify it in place.
 
     Args:
         url (str): The URL of a specific section in the MOT inspection manual.
@@ -41,46 +96,112 @@ def get_dropdowns(url: str) -> List[BeautifulSoup]:
     Returns:
         List[BeautifulSoup]: A list of BeautifulSoup objects representing each dropdown section.
     """
-    html = requests.get(url).text
-    soup = BeautifulSoup(html, "html.parser")
-    return soup.find_all("div", class_="govuk-accordion__section")
+    response = _SESSION.get(url, timeout=30)
+    response.raise_for_status()
+    return parse_dropdowns(response.text)
+
+
+def parse_dropdowns(html: str) -> List[BeautifulSoup]:
+    """
+    Parse the dropdown sections out of an already downloaded section page.
+
+    Args:
+        html (str): The HTML of a specific section in the MOT inspection manual.
+
+    Returns:
+        List[BeautifulSoup]: A list of BeautifulSoup objects representing each dropdown section.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    return soup.select("div.govuk-accordion__section")
+
+
+def fetch_all_dropdowns(urls: List[str], max_workers: int = 8) -> List[List[BeautifulSoup]]:
+    """
+    Retrieve the dropdown sections for several section pages concurrently.
+
+    Args:
+        urls (List[str]): The URLs of the sections to download, e.g. the output of get_section_urls.
+        max_workers (int): Number of pages fetched at once. Kept small to be polite to gov.uk. Defaults to 8.
+
+    Returns:
+        List[List[BeautifulSoup]]: The dropdowns of each section, in the same order as urls.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_dropdowns, urls))
+
+
+async def fetch_all_html(urls: List[str], max_connections: int = 4) -> List[str]:
+    """
+    Download several pages concurrently over HTTP/2, multiplexed on as few connections as possible.
 
+    Args:
+        urls (List[str]): The URLs to download.
+        max_connections (int): Upper bound on open connections to gov.uk. Defaults to 4.
 
-def find_heading(tag_list, re_pattern, parent_heading):
+    Returns:
+        List[str]: The HTML of each page, in the same order as urls.
+    """
+    if httpx is None:
+        raise ImportError("HTTP/2 fetching needs httpx, install it with `pip install httpx[http2]`")
+
+    limits = httpx.Limits(max_connections=max_connections)
+    async with httpx.AsyncClient(http2=True, headers=_HEADERS, timeout=30, limits=limits, follow_redirects=True) as client:
+        responses = await asyncio.gather(*(client.get(url) for url in urls))
+    # There are no retries on this path, so an error page must raise rather than parse as zero dropdowns
+    for response in responses:
+        response.raise_for_status()
+    return [response.text for response in responses]
+
+
+def fetch_all_dropdowns_http2(urls: List[str], max_connections: int = 4) -> List[List[BeautifulSoup]]:
+    """
+    Same as fetch_all_dropdowns but downloads every page over HTTP/2 first, then parses them.
+    Uses asyncio.run, so inside a notebook (which already runs an event loop) await fetch_all_html
+        yourself and pass each page to parse_dropdowns.
+
+    Args:
+        urls (List[str]): The URLs of the sections to download, e.g. the output of get_section_urls.
+        max_connections (int): Upper bound on open connections to gov.uk. Defaults to 4.
+
+    Returns:
+        List[List[BeautifulSoup]]: The dropdowns of each section, in the same order as urls.
+    """
+    htmls = asyncio.run(fetch_all_html(urls, max_connections))
+    return [parse_dropdowns(html) for html in htmls]
+
+
+def find_heading(tag_list, pattern, parent_heading):
     """
     Parent section number is bascially the regex pattern minus 1.
     Reason for this is we can end up finding sections where the parent section is not associated with 
         the desried h3/h4 etc section
 
         Example is 1.2. When finding a parent h3 we will find 
+
+    pattern is a precompiled regex such as _H3_PAT or _H4_PAT.
     """
-    pattern = re.compile(re_pattern)
-    
     headings = []
     numbers = []
     for item in tag_list:
         if parent_heading not in item.text.split(' ')[0]:
             continue
-        match = re.search(pattern,item.text)
+        match = pattern.search(item.text)
         if match:
             num = int(''.join(match.group().split('.')))
             headings.append(item)
             numbers.append(num)
-    try:
-        # max_num = np.max(numbers)
-        index = np.argmax(numbers)
-        
-        # max)num is not useful!
-        # go to headings index. pull out the text object i.e .text.split(' ')[0]
-        return headings[index].text.strip()
-        
-    except ValueError:  
+    if not numbers:
         return None
+    # builtin max beats np.argmax on lists this small, and also returns the first highest number
+    index = max(range(len(numbers)), key=numbers.__getitem__)
+
+    # go to headings index. pull out the text object i.e .text.split(' ')[0]
+    return headings[index].text.strip()
 
 
 def split_and_prepend_defects(text):
     # Find the first set of parentheses and set it as the main defect descriptor
-    first_paren_match = re.match(r'^(.*?)(?=\(\s*[a-z]+\))', text)
+    first_paren_match = _FIRST_PAREN.match(text)
     if first_paren_match:
         main_defect = first_paren_match.group(0).strip()
     else:
@@ -90,11 +211,8 @@ def split_and_prepend_defects(text):
     sections = []
     start_idx = 0  # Starting index for section text
 
-    # Pattern to find lowercase Roman numerals in parentheses
-    pattern = re.compile(r'(?=\(\s*[ivxlcdm]+\))')  # Only capture sections with lowercase Roman numerals
-
-    # Loop through matches of the pattern in the text
-    for match in pattern.finditer(text):
+    # Loop through lowercase Roman numerals in parentheses, only these start a new section
+    for match in _ROMAN_SPLIT.finditer(text):
         # Capture each section from start_idx up to the start of the match
         section = text[start_idx:match.start()].strip()
         if section:
@@ -116,7 +234,7 @@ def split_and_prepend_defects(text):
 
 def extract_parentheses(text):
         # Find the first set of parentheses
-        first_match = re.search(r'\([^()]*\)', text)
+        first_match = _FIRST_MATCH.search(text)
         matches = []
     
         # Add the first match if found
@@ -125,79 +243,110 @@ def extract_parentheses(text):
             start_idx = first_match.end()  # Update the starting index for the next search
     
             # Find subsequent parentheses with Roman numerals
-            roman_matches = re.findall(r'\(\s*[ivxlcdm]+\s*\)', text[start_idx:])
+            roman_matches = _ROMAN_PARENS.findall(text, start_idx)
             matches.extend(roman_matches)
         
         return " ".join(matches)
 
+def _cell_text(cell):
+    # Like pd.read_html, a <br> counts as a line break so e.g. "Minor<br>Major" still splits into two categories
+    text = "".join(
+        "\n" if element.name == "br" else element
+        for element in cell.descendants
+        if element.name == "br" or type(element) is NavigableString
+    )
+    return _CELL_WHITESPACE.sub(" ", text.strip())
+
+def table_to_df(table):
+    """
+    Build a DataFrame straight from a parsed bs4 table, using its th cells as the columns.
+    Replaces pd.read_html(StringIO(str(table))) which serialised the table back to html only to parse it again.
+    """
+    headers = [_cell_text(th) for th in table.find_all('th')]
+    width = len(headers)
+    rows = [[_cell_text(td) for td in tds] for tds in (tr.find_all('td') for tr in table.find_all('tr')) if tds]
+    # Fit every row to the header, a stray extra cell is dropped and a missing one left blank
+    rows = [(row + [''] * width)[:width] for row in rows]
+    return pd.DataFrame(rows, columns=headers)
+
+def _tables_with_headings(sub_section, names):
+    """
+    Walk a dropdown section once and pair every table with the headings of each name that come before it.
+    previous[name] lists them in document order, so reversed(previous[name]) matches table.find_all_previous(name),
+        but the document is only walked backwards once per section rather than once per table and heading.
+    Nothing is copied per table, previous is updated as the walk goes on so only read it before the next table.
+    """
+    previous = {name: [] for name in names}
+    for heading in reversed(sub_section.find_all_previous(list(names))):
+        previous[heading.name].append(heading)
+    for tag in sub_section.find_all(["table", *names]):
+        if tag.name == "table":
+            yield tag, previous
+        else:
+            previous[tag.name].append(tag)
+
+def _nearest(headings):
+    return headings[-1] if headings else None
+
 def gen_mot_pandas(dropdowns):
 
-    
-    h3_pattern = r"^(\d+\.[0-9]+\.[0-9]+)"
-    h4_pattern = r'^(\d+\.[0-9]+\.[0-9]+\.[0-9])'
     df_list = []
     
     for idx, sub_section in enumerate(dropdowns):
 
-        tables = sub_section.find_all("table")
-        
-        
-        for table in tables:
+        for table, previous in _tables_with_headings(sub_section, ("h1", "h2", "h3", "h4")):
 
             #This will skip headers that are not what we want
             #example is in 3.3 there are two tables 1 is bs we dont want.
-            all_th = table.find_all('th')
-            to_skip = [th.text in ['Defect','Category'] for th in all_th]
-            if sum(to_skip) < len(to_skip):
+            if not all(th.get_text(strip=True) in {'Defect', 'Category'} for th in table.find_all('th')):
                 continue
             
             
-            h1 = table.find_previous("h1") or table.find_previous(class_="manual-title")
+            h1 = _nearest(previous["h1"]) or table.find_previous(class_="manual-title")
             h1_heading = h1.text.strip()
-            h1_mumber = int(h1_heading.split(' ')[0].rstrip('.'))
+            h1_mumber = int(_NUM_PREFIX.match(h1_heading).group(1))
             
-            h2 = table.find_previous("h2")
+            h2 = _nearest(previous["h2"])
             h2_heading = h2.text.strip()
-            h2_mumber = int(h2_heading.split(' ')[0].rstrip('.').split('.')[-1])
+            h2_mumber = int(_NUM_PREFIX.match(h2_heading).group(1).split('.')[-1])
             #Sometimes tables are not below the initial h3 or 4
-            all_h3 = table.find_all_previous('h3')
+            all_h3 = reversed(previous['h3'])
             
             
             h3 = None
             h4 = None
             
-            h3_heading = find_heading(all_h3, h3_pattern, h2_heading.split(' ')[0])
+            h3_heading = find_heading(all_h3, _H3_PAT, h2_heading.split(' ')[0])
 
             if h3_heading:
-                h3_sections = h3_heading.split(' ')[0].rstrip('.').split('.')
+                h3_sections = _NUM_PREFIX.match(h3_heading).group(1).split('.')
                 # Check if there are enough parts in h3_sections before accessing them
                 
                 if len(h3_sections) > 1:
-                    all_h4 = table.find_all_previous('h4')
-                    h4_heading = find_heading(all_h4, h4_pattern, h3_heading.split(' ')[0])
-                    if int(h3_sections[-2]) == h2_mumber:
+                    all_h4 = reversed(previous['h4'])
+                    h4_heading = find_heading(all_h4, _H4_PAT, h3_heading.split(' ')[0])
+                    h3_in_h2 = int(h3_sections[-2]) == h2_mumber
+                    if h3_in_h2:
                         h3 = '.'.join(h3_sections)
                     else:
                         h3 = None
             
                     if h4_heading:
-                        h4_sections = h4_heading.split(' ')[0].rstrip('.').split('.')
+                        h4_sections = _NUM_PREFIX.match(h4_heading).group(1).split('.')
                         
                         # Check lengths to avoid IndexError
-                        if (int(h4_sections[-2]) == int(h3_sections[-1])) and (int(h3_sections[-2]) == h2_mumber):
+                        if (int(h4_sections[-2]) == int(h3_sections[-1])) and h3_in_h2:
                             h4 = '.'.join(h4_sections)
                         else:
                             h4 = None
 
 
-            # pandas requires it to be stringio
-            df = pd.read_html(StringIO(str(table)))[0]
-            df = df[~df.Defect.str.contains('Not in use')]
+            df = table_to_df(table)
+            df = df[~df.Defect.str.contains('Not in use', regex=False)]
             
             df['Defect'] = df.Defect.apply(split_and_prepend_defects)
             
-            allowed_values = {'Major','Minor', 'Dangerous'}
-            df['Category'] = df.Category.str.split(' ').apply(lambda x: [item for item in x if item in allowed_values])
+            df['Category'] = df.Category.map(_CATEGORY_PAT.findall)
             
             df = df.explode(['Defect','Category']).reset_index(drop=True)
             df['section_name'] = ' '.join(h1_heading.split(' ')[1:])
@@ -214,33 +363,16 @@ def gen_mot_pandas(dropdowns):
     
             df['point'] = df.Defect.apply(extract_parentheses)
 
-            # Initialize `full_reference_code` based on available headings
-            if h3 and h4:
-                # Both `h3` and `h4` are available
-                df['full_reference_code'] = (
-                    df['section_number'].astype(str) + "." + 
-                    df['sub_section_number'].astype(str) + "." + 
-                    df['topic_number'].astype(str) + "." + 
-                    df['sub_topic_number'].astype(str) + " " + 
-                    df['point']
-                )
-            elif h3:
-                # Only `h3` is available
-                df['full_reference_code'] = (
-                    df['section_number'].astype(str) + "." + 
-                    df['sub_section_number'].astype(str) + "." + 
-                    df['topic_number'].astype(str) + " " + 
-                    df['point']
-                )
-            else:
-                # Only section and sub-section numbers are available
-                df['full_reference_code'] = (
-                    df['section_number'].astype(str) + "." + 
-                    df['sub_section_number'].astype(str) + " " + 
-                    df['point']
-                )
+            # Every number in the code is the same for the whole table, so join them once and only
+            # concatenate the point column, whatever headings are available
+            code_parts = [h1_mumber, h2_mumber]
+            if h3:
+                code_parts.append(int(h3_sections[-1]))
+            if h4:
+                code_parts.append(int(h4_sections[-1]))
+            df['full_reference_code'] = '.'.join(map(str, code_parts)) + " " + df['point']
             df_list.append(df)
-    concat_df = pd.concat(df_list).reset_index(drop=True)
+    concat_df = pd.concat(df_list, ignore_index=True)
     return concat_df
 
 def generate_mot_table(dropdowns: List[BeautifulSoup]) -> pd.DataFrame:
@@ -251,19 +383,14 @@ def generate_mot_table(dropdowns: List[BeautifulSoup]) -> pd.DataFrame:
     As a result I am leaving this here as a reminger to myself... Trying a simpler approach with a data processing library like pandas
         is not a skill issue... There is a reason this library exists dag nabbit
     """
-    sub_section_dfs: Dict[int, List[pd.DataFrame]] = {}
+    df_list: List[pd.DataFrame] = []
     # Comprehensive regex pattern for flexible section matching across various formats (e.g., "5.3 (a) (ii)", "10.2")
     section_pattern = re.compile(r"^(\d+\.[0-9]+(\.[0-9])?)")
 
-    for idx, sub_section in enumerate(dropdowns):
-        tables = sub_section.find_all("table")
-        sub_section_dfs[idx + 1] = []
-
-        for table in tables:
+    for sub_section in dropdowns:
+        for table, previous in _tables_with_headings(sub_section, ("h1", "h2", "h3")):
             # Find appropriate section heading and filter out irrelevant headings
-            h1 = table.find_previous("h1")
-            h2 = table.find_previous("h2")
-            h3 = table.find_previous("h3")
+            h1, h2, h3 = (_nearest(previous[name]) for name in ("h1", "h2", "h3"))
             
             # Use h2/h3 based on section structure, but skip "Not in use" and irrelevant content
             section_heading = h2 if h2 and section_pattern.match(h2.text) else h3
@@ -277,21 +404,26 @@ def generate_mot_table(dropdowns: List[BeautifulSoup]) -> pd.DataFrame:
             section_id = section_heading["id"].replace("section-", "").replace("-", ".") if section_heading and section_heading.get("id") else ""
 
             # Define columns and prepare rows with consistent full reference code formatting
+            # Every data row sits under the same header, so check its last th once rather than per row
+            all_th = table.find_all("th")
+            if not all_th or all_th[-1].text not in ["Category", "Defect"]:
+                continue
+
             columns = ["section_name", "subsection_name", "component_name", "full_reference_code"]
-            columns += [th.text.strip() for th in table.find_all("th")]
+            columns += [th.text.strip() for th in all_th]
             rows = []
 
-            for tr in table.find_all("tr")[1:]:
-                if tr.find_previous("th").text not in ["Category", "Defect"]:
-                    continue
+            trs = iter(table.find_all("tr"))
+            next(trs, None)  # header row
+            for tr in trs:
                 cells = tr.find_all("td")
                 if len(cells) == 2:
                     defect_cell = cells[0]
                     category_cell = cells[1]
-                    categories = category_cell.get_text(separator="|||", strip=True).split("|||")
+                    # An empty cell still gives one blank category so categories[0] below is safe
+                    categories = list(category_cell.stripped_strings) or [""]
                     category = categories[0].strip()
-                    main_text = defect_cell.get_text(separator="|||", strip=True)
-                    parts = main_text.split("|||")
+                    parts = list(defect_cell.stripped_strings)
 
                     # Handle entries to format as "5.3 (a) (ii)"
                     if len(parts) > 1:
@@ -313,23 +445,18 @@ def generate_mot_table(dropdowns: List[BeautifulSoup]) -> pd.DataFrame:
 
             if rows:
                 df = pd.DataFrame(rows, columns=columns)
-                sub_section_dfs[idx + 1].append(df)
+                df_list.append(df)
 
-        if sub_section_dfs[idx + 1]:
-            sub_section_dfs[idx + 1] = pd.concat(sub_section_dfs[idx + 1], ignore_index=True)
-            
-    final_df = pd.concat([v for v in sub_section_dfs.values() if len(v) > 0], ignore_index=True)
+    final_df = pd.concat(df_list, ignore_index=True)
+    string_cols = ['section_name', 'subsection_name', 'component_name', 'full_reference_code', 'Defect', 'Category']
+    final_df[string_cols] = final_df[string_cols].astype(_STRING_DTYPE)
 
-    final_df['section_number'] = final_df.section_name.str.split('.').str[0].str.rstrip('.')
-    final_df['section_name'] = final_df.section_name.str.split(' ').str[1:].str.join(' ')
-    
-    final_df['subsection_number'] = final_df.subsection_name.str.split(' ').str[0].str.rstrip('.').str[-1]
-    final_df['subsection_name'] = final_df.subsection_name.str.split(' ').str[1:].str.join(' ')
-    
-    final_df['component_number'] = final_df.component_name.str.split(' ').str[0].str.rstrip('.').str[-1]
-    final_df['component_name'] = final_df.component_name.str.split(' ').str[1:].str.join(' ')
+    # One regex pass per column pulls out the (last) heading number and the name together
+    final_df[['section_number', 'section_name']] = final_df.section_name.str.extract(_SEC_EXTRACT).fillna('')
+    final_df[['subsection_number', 'subsection_name']] = final_df.subsection_name.str.extract(_SEC_EXTRACT).fillna('')
+    final_df[['component_number', 'component_name']] = final_df.component_name.str.extract(_SEC_EXTRACT).fillna('')
 
-    final_df['type_ref'] = final_df['Defect'].str.split(' ').str[0].str.strip('()')
-    final_df['sub_type_ref'] = np.where(final_df.full_reference_code.str.split(' ').apply(len).eq(3), final_df.full_reference_code.str.split(' ').str[-1].str.strip('()'),"")
+    final_df['type_ref'] = final_df['Defect'].str.extract(_TYPE_REF, expand=False).fillna('')
+    final_df['sub_type_ref'] = final_df.full_reference_code.str.extract(_SUB_TYPE_REF)[1].fillna('')
     col_order = ['section_name','section_number','subsection_name','subsection_number','component_name','component_number','type_ref','sub_type_ref','full_reference_code','Defect','Category'] 
     return final_df[col_order]